@@ -4,15 +4,21 @@ Asset management service for fonts, color schemes, and templates
 Version: 20250602_000000_0_0_0_001
 """
 
-from flask import Flask, request, jsonify, send_file, render_template
+from flask import Flask, Response, request, jsonify, send_file, render_template
 from services.asset_manager import AssetManager
 from services.font_service import FontService
 from services.color_scheme_service import ColorSchemeService
 from services.template_service import TemplateService
+from werkzeug.exceptions import HTTPException
 import logging
 import os
 
 app = Flask(__name__)
+# Deployment settings come from FLASK_* environment variables, e.g.
+# FLASK_USE_X_SENDFILE=true hands font/template downloads to nginx/Apache
+app.config.from_prefixed_env()
+# Responses are serialized on every request; skip sorting every dict's keys
+app.json.sort_keys = False
 logging.basicConfig(level=logging.INFO)
 
 asset_manager = AssetManager()
@@ -20,163 +26,174 @@ font_service = FontService()
 color_scheme_service = ColorSchemeService()
 template_service = TemplateService()
 
+# Static responses are serialized once instead of on every request, in the
+# compact form jsonify produces (no spaces, trailing newline)
+_JSON_SEPARATORS = (',', ':')
+_INDEX_RESPONSE = app.json.dumps({
+    'service': 'style-assets',
+    'version': '20250602_000000_0_0_0_001',
+    'endpoints': {
+        'fonts': '/api/fonts',
+        'color_schemes': '/api/color-schemes',
+        'templates': '/api/templates',
+        'assets': '/api/assets'
+    }
+}, separators=_JSON_SEPARATORS) + '\n'
+_HEALTH_RESPONSE = app.json.dumps(
+    {'status': 'healthy', 'service': 'style-assets'}, separators=_JSON_SEPARATORS
+) + '\n'
+
+# Error message returned for an unexpected failure in each endpoint
+_ENDPOINT_ERRORS = {
+    'get_fonts': 'Failed to retrieve fonts',
+    'get_font_details': 'Failed to retrieve font details',
+    'download_font': 'Failed to download font',
+    'get_color_schemes': 'Failed to retrieve color schemes',
+    'get_color_scheme': 'Failed to retrieve color scheme',
+    'create_color_scheme': 'Failed to create color scheme',
+    'get_color_scheme_css': 'Failed to generate color scheme CSS',
+    'get_templates': 'Failed to retrieve templates',
+    'get_template': 'Failed to retrieve template',
+    'download_template': 'Failed to download template',
+    'create_asset_bundle': 'Failed to create asset bundle',
+    'stream_asset_bundle': 'Failed to stream asset bundle',
+    'validate_assets': 'Failed to validate assets',
+    'sync_assets': 'Failed to sync assets'
+}
+
+@app.errorhandler(Exception)
+def handle_unexpected_error(error):
+    """Log unexpected errors and return the endpoint's generic error message"""
+    message = _ENDPOINT_ERRORS.get(request.endpoint)
+    if message is None and isinstance(error, HTTPException):
+        # Routing errors such as unknown URLs keep their own status
+        return error
+    app.logger.error(f"Error in {request.endpoint}: {str(error)}")
+    return jsonify({'error': message or 'Internal server error'}), 500
+
 @app.route('/')
 def index():
     """Main interface for style assets"""
-    return jsonify({
-        'service': 'style-assets',
-        'version': '20250602_000000_0_0_0_001',
-        'endpoints': {
-            'fonts': '/api/fonts',
-            'color_schemes': '/api/color-schemes',
-            'templates': '/api/templates',
-            'assets': '/api/assets'
-        }
-    })
+    return Response(_INDEX_RESPONSE, mimetype='application/json')
 
 @app.route('/api/fonts', methods=['GET'])
 def get_fonts():
     """Get available fonts"""
-    try:
-        fonts = font_service.get_available_fonts()
-        return jsonify(fonts)
-    except Exception as e:
-        app.logger.error(f"Error getting fonts: {str(e)}")
-        return jsonify({'error': 'Failed to retrieve fonts'}), 500
+    # The font list is encoded once per registration rather than per request
+    return Response(font_service.get_available_fonts_json(), mimetype='application/json')
 
 @app.route('/api/fonts/<font_name>', methods=['GET'])
 def get_font_details(font_name):
     """Get details for specific font"""
-    try:
-        font_details = font_service.get_font_details(font_name)
-        if font_details:
-            return jsonify(font_details)
-        else:
-            return jsonify({'error': 'Font not found'}), 404
-    except Exception as e:
-        app.logger.error(f"Error getting font details: {str(e)}")
-        return jsonify({'error': 'Failed to retrieve font details'}), 500
+    font_details = font_service.get_font_details(font_name)
+    if font_details:
+        return jsonify(font_details)
+    else:
+        return jsonify({'error': 'Font not found'}), 404
 
 @app.route('/api/fonts/<font_name>/download', methods=['GET'])
 def download_font(font_name):
     """Download font file"""
-    try:
-        font_path = font_service.get_font_path(font_name)
-        if font_path and os.path.exists(font_path):
-            return send_file(font_path, as_attachment=True)
-        else:
-            return jsonify({'error': 'Font file not found'}), 404
-    except Exception as e:
-        app.logger.error(f"Error downloading font: {str(e)}")
-        return jsonify({'error': 'Failed to download font'}), 500
+    font_path = font_service.get_font_path(font_name)
+    if font_path and os.path.exists(font_path):
+        return send_file(font_path, as_attachment=True)
+    else:
+        return jsonify({'error': 'Font file not found'}), 404
 
 @app.route('/api/color-schemes', methods=['GET'])
 def get_color_schemes():
     """Get available color schemes"""
-    try:
-        schemes = color_scheme_service.get_available_schemes()
-        return jsonify(schemes)
-    except Exception as e:
-        app.logger.error(f"Error getting color schemes: {str(e)}")
-        return jsonify({'error': 'Failed to retrieve color schemes'}), 500
+    schemes = color_scheme_service.get_available_schemes()
+    return jsonify(schemes)
 
 @app.route('/api/color-schemes/<scheme_name>', methods=['GET'])
 def get_color_scheme(scheme_name):
     """Get specific color scheme"""
-    try:
-        scheme = color_scheme_service.get_scheme(scheme_name)
-        if scheme:
-            return jsonify(scheme)
-        else:
-            return jsonify({'error': 'Color scheme not found'}), 404
-    except Exception as e:
-        app.logger.error(f"Error getting color scheme: {str(e)}")
-        return jsonify({'error': 'Failed to retrieve color scheme'}), 500
+    scheme = color_scheme_service.get_scheme(scheme_name)
+    if scheme:
+        return jsonify(scheme)
+    else:
+        return jsonify({'error': 'Color scheme not found'}), 404
+
+@app.route('/api/color-schemes/<scheme_name>/css', methods=['GET'])
+def get_color_scheme_css(scheme_name):
+    """Get color scheme as a CSS stylesheet"""
+    css_format = request.args.get('format', 'complete')
+    result = color_scheme_service.stream_css(scheme_name, css_format)
+    if result is None:
+        return jsonify({'error': 'Color scheme not found'}), 404
+    if not result['success']:
+        return jsonify(result), 400
+    # Served as text/css so the stylesheet is not escaped into a JSON string
+    return Response(result['css_chunks'], mimetype='text/css')
 
 @app.route('/api/color-schemes', methods=['POST'])
 def create_color_scheme():
     """Create new color scheme"""
-    try:
-        scheme_data = request.get_json()
-        result = color_scheme_service.create_scheme(scheme_data)
-        return jsonify(result)
-    except Exception as e:
-        app.logger.error(f"Error creating color scheme: {str(e)}")
-        return jsonify({'error': 'Failed to create color scheme'}), 500
+    scheme_data = request.get_json()
+    result = color_scheme_service.create_scheme(scheme_data)
+    return jsonify(result)
 
 @app.route('/api/templates', methods=['GET'])
 def get_templates():
     """Get available templates"""
-    try:
-        templates = template_service.get_available_templates()
-        return jsonify(templates)
-    except Exception as e:
-        app.logger.error(f"Error getting templates: {str(e)}")
-        return jsonify({'error': 'Failed to retrieve templates'}), 500
+    # The template list is encoded once; only the response metadata is encoded per request
+    return Response(template_service.get_available_templates_json(), mimetype='application/json')
 
 @app.route('/api/templates/<template_name>', methods=['GET'])
 def get_template(template_name):
     """Get specific template"""
-    try:
-        template = template_service.get_template(template_name)
-        if template:
-            return jsonify(template)
-        else:
-            return jsonify({'error': 'Template not found'}), 404
-    except Exception as e:
-        app.logger.error(f"Error getting template: {str(e)}")
-        return jsonify({'error': 'Failed to retrieve template'}), 500
+    template = template_service.get_template(template_name)
+    if template:
+        return jsonify(template)
+    else:
+        return jsonify({'error': 'Template not found'}), 404
 
 @app.route('/api/templates/<template_name>/download', methods=['GET'])
 def download_template(template_name):
     """Download template file"""
-    try:
-        template_path = template_service.get_template_path(template_name)
-        if template_path and os.path.exists(template_path):
-            return send_file(template_path, as_attachment=True)
-        else:
-            return jsonify({'error': 'Template file not found'}), 404
-    except Exception as e:
-        app.logger.error(f"Error downloading template: {str(e)}")
-        return jsonify({'error': 'Failed to download template'}), 500
+    template_path = template_service.get_template_path(template_name)
+    if template_path and os.path.exists(template_path):
+        return send_file(template_path, as_attachment=True)
+    else:
+        return jsonify({'error': 'Template file not found'}), 404
 
 @app.route('/api/assets/bundle', methods=['POST'])
 def create_asset_bundle():
     """Create asset bundle for specific style"""
-    try:
-        bundle_config = request.get_json()
-        result = asset_manager.create_bundle(bundle_config)
-        return jsonify(result)
-    except Exception as e:
-        app.logger.error(f"Error creating asset bundle: {str(e)}")
-        return jsonify({'error': 'Failed to create asset bundle'}), 500
+    bundle_config = request.get_json()
+    result = asset_manager.create_bundle(bundle_config)
+    return jsonify(result)
+
+@app.route('/api/assets/bundle/stream', methods=['POST'])
+def stream_asset_bundle():
+    """Stream asset bundle as a ZIP archive"""
+    bundle_config = request.get_json()
+    bundle_id, bundle_stream = asset_manager.stream_bundle(bundle_config)
+    return Response(
+        bundle_stream,
+        mimetype='application/zip',
+        headers={'Content-Disposition': f'attachment; filename={bundle_id}.zip'}
+    )
 
 @app.route('/api/assets/validate', methods=['POST'])
 def validate_assets():
     """Validate asset compatibility"""
-    try:
-        asset_config = request.get_json()
-        result = asset_manager.validate_assets(asset_config)
-        return jsonify(result)
-    except Exception as e:
-        app.logger.error(f"Error validating assets: {str(e)}")
-        return jsonify({'error': 'Failed to validate assets'}), 500
+    asset_config = request.get_json()
+    result = asset_manager.validate_assets(asset_config)
+    return jsonify(result)
 
 @app.route('/api/assets/sync', methods=['POST'])
 def sync_assets():
     """Sync assets with other services"""
-    try:
-        sync_config = request.get_json()
-        result = asset_manager.sync_with_services(sync_config)
-        return jsonify(result)
-    except Exception as e:
-        app.logger.error(f"Error syncing assets: {str(e)}")
-        return jsonify({'error': 'Failed to sync assets'}), 500
+    sync_config = request.get_json()
+    result = asset_manager.sync_with_services(sync_config)
+    return jsonify(result)
 
 @app.route('/health')
 def health_check():
     """Health check endpoint"""
-    return jsonify({'status': 'healthy', 'service': 'style-assets'})
+    return Response(_HEALTH_RESPONSE, mimetype='application/json')
 
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5003)
\ No newline at end of file
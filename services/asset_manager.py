@@ -5,11 +5,138 @@ Manages style assets across the ecosystem
 
 import os
 import json
+import time
 import zipfile
 import shutil
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterator, Mapping, Tuple
 from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
 import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# Number of bundles kept in the registry; the oldest entries are evicted first
+_BUNDLE_REGISTRY_LIMIT = 1024
+
+# Threads kept for the asset checks and service syncs of all requests
+_WORKER_THREADS = 32
+
+# Assets checked by one thread at a time; groups no larger than this are
+# checked on the request thread, where a handoff would cost more than it saves
+_VALIDATION_BATCH_SIZE = 64
+
+# Upper bound on asset filesystem calls in flight across all request threads
+_IO_CONCURRENCY_LIMIT = 32
+
+# File extensions accepted by asset validation
+_FONT_EXTENSIONS = frozenset({'.ttf', '.otf', '.woff', '.woff2'})
+_TEMPLATE_EXTENSIONS = frozenset({'.html', '.css', '.js', '.tex', '.md'})
+
+# Formats that are already compressed; deflating them only costs CPU
+_PRECOMPRESSED_EXTENSIONS = frozenset({
+    '.woff', '.woff2', '.png', '.jpg', '.jpeg', '.gif', '.webp', '.zip', '.gz'
+})
+
+# DEFLATE level for bundle members; level 1 deflates fonts about twice as
+# fast as the zlib default (6) for roughly 5% larger output
+_DEFLATE_LEVEL = 1
+
+# Smallest block of ZIP output yielded (and hashed) while copying assets
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Read size used when copying asset files into a bundle
+_COPY_BLOCK_SIZE = 1024 * 1024
+
+_MANIFEST_ENCODER = json.JSONEncoder(indent=2)
+
+# Style asset tables are shared by every call, so their entries are read-only
+_DEFAULT_STYLE_FONTS = (
+    MappingProxyType({
+        'name': 'Times New Roman',
+        'filename': 'times-new-roman.ttf',
+        'path': 'fonts/times-new-roman.ttf',
+        'type': 'serif',
+        'weight': 'normal'
+    }),
+    MappingProxyType({
+        'name': 'Arial',
+        'filename': 'arial.ttf',
+        'path': 'fonts/arial.ttf',
+        'type': 'sans-serif',
+        'weight': 'normal'
+    })
+)
+
+# Style-specific font mappings
+_STYLE_FONTS = {
+    'ieee': (_DEFAULT_STYLE_FONTS[0],),  # Times New Roman
+    'nature': (_DEFAULT_STYLE_FONTS[0],),  # Times New Roman
+    'apa': (_DEFAULT_STYLE_FONTS[0],),  # Times New Roman
+    'modern': (_DEFAULT_STYLE_FONTS[1],)  # Arial
+}
+
+_DEFAULT_STYLE_COLOR_SCHEMES = (
+    MappingProxyType({
+        'name': 'Academic',
+        'filename': 'academic.json',
+        'path': 'color_schemes/academic.json',
+        'type': 'professional'
+    }),
+    MappingProxyType({
+        'name': 'Modern Blue',
+        'filename': 'modern_blue.json',
+        'path': 'color_schemes/modern_blue.json',
+        'type': 'contemporary'
+    })
+)
+
+@lru_cache(maxsize=64)
+def _style_templates(style_name: str) -> Tuple[Mapping[str, Any], ...]:
+    """Build template entries for a style"""
+    return (
+        MappingProxyType({
+            'name': f'{style_name.upper()} Article Template',
+            'filename': f'{style_name}_article.html',
+            'path': f'templates/{style_name}_article.html',
+            'type': 'article'
+        }),
+        MappingProxyType({
+            'name': f'{style_name.upper()} CSS',
+            'filename': f'{style_name}.css',
+            'path': f'templates/{style_name}.css',
+            'type': 'stylesheet'
+        })
+    )
+
+class _ZipStreamWriter:
+    """Write-only file object that buffers ZIP output until it is drained"""
+    
+    def __init__(self):
+        self._buffer = bytearray()
+        self._position = 0
+    
+    def write(self, data) -> int:
+        self._buffer += data
+        self._position += len(data)
+        return len(data)
+    
+    def tell(self) -> int:
+        return self._position
+    
+    def flush(self):
+        pass
+    
+    def pending(self) -> int:
+        """Return number of buffered bytes"""
+        return len(self._buffer)
+    
+    def drain(self) -> bytes:
+        """Return buffered output and reset the buffer"""
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
 
 class AssetManager:
     """Service for managing style assets"""
@@ -19,6 +146,10 @@ class AssetManager:
         self.bundle_directory = 'bundles'
         self._ensure_directories()
         self.asset_registry = self._initialize_asset_registry()
+        self._bundles_lock = threading.Lock()
+        self._io_sem = threading.BoundedSemaphore(_IO_CONCURRENCY_LIMIT)
+        # Started once and reused, so requests do not pay for new threads
+        self._executor = ThreadPoolExecutor(max_workers=_WORKER_THREADS)
     
     def _ensure_directories(self):
         """Ensure required directories exist"""
@@ -34,7 +165,7 @@ class AssetManager:
             'fonts': {},
             'color_schemes': {},
             'templates': {},
-            'bundles': {},
+            'bundles': OrderedDict(),
             'metadata': {
                 'last_updated': self._get_timestamp(),
                 'version': '1.0.0'
@@ -51,18 +182,61 @@ class AssetManager:
         Returns:
             Dictionary containing bundle information
         """
+        manifest = self._prepare_bundle(bundle_config)
+        bundle_id = manifest['bundle_id']
+        bundle_name = manifest['bundle_name']
+        style_name = manifest['style']
+        bundle_path = os.path.join(self.bundle_directory, f'{bundle_id}.zip')
+        
+        # Create ZIP bundle, hashing the archive bytes as they are written
+        checksum = self._new_checksum()
+        bundle_size = 0
+        with open(bundle_path, 'wb') as bundle_file:
+            for chunk in self._iter_bundle_chunks(manifest, checksum):
+                bundle_file.write(chunk)
+                bundle_size += len(chunk)
+        bundle_checksum = checksum.hexdigest()
+        
+        self._register_bundle(manifest, bundle_path, bundle_size, bundle_checksum)
+        
+        return {
+            'success': True,
+            'bundle_id': bundle_id,
+            'bundle_name': bundle_name,
+            'style': style_name,
+            'bundle_path': bundle_path,
+            'bundle_size': bundle_size,
+            'checksum': bundle_checksum,
+            'checksum_algorithm': 'blake2b',
+            'asset_count': {
+                'fonts': len(manifest['assets']['fonts']),
+                'color_schemes': len(manifest['assets']['color_schemes']),
+                'templates': len(manifest['assets']['templates'])
+            },
+            'download_url': f'/api/bundles/{bundle_id}/download',
+            'timestamp': self._get_timestamp()
+        }
+    
+    def stream_bundle(self, bundle_config: Dict[str, Any]) -> Tuple[str, Iterator[bytes]]:
+        """
+        Create asset bundle as a ZIP stream without staging it to disk
+        
+        Args:
+            bundle_config: Bundle configuration
+            
+        Returns:
+            Tuple of bundle ID and an iterator over the ZIP archive bytes
+        """
+        manifest = self._prepare_bundle(bundle_config)
+        return manifest['bundle_id'], self._stream_bundle_chunks(manifest)
+    
+    def _prepare_bundle(self, bundle_config: Dict[str, Any]) -> Dict[str, Any]:
+        """Build bundle manifest listing the existing assets for a style"""
         bundle_name = bundle_config.get('name', 'default_bundle')
         style_name = bundle_config.get('style', 'default')
-        include_fonts = bundle_config.get('include_fonts', True)
-        include_color_schemes = bundle_config.get('include_color_schemes', True)
-        include_templates = bundle_config.get('include_templates', True)
-        
-        bundle_id = self._generate_bundle_id(bundle_name, style_name)
-        bundle_path = os.path.join(self.bundle_directory, f'{bundle_id}.zip')
         
-        # Create bundle manifest
         manifest = {
-            'bundle_id': bundle_id,
+            'bundle_id': self._generate_bundle_id(bundle_name, style_name),
             'bundle_name': bundle_name,
             'style': style_name,
             'created': self._get_timestamp(),
@@ -74,44 +248,113 @@ class AssetManager:
             'metadata': bundle_config.get('metadata', {})
         }
         
-        # Create ZIP bundle
-        with zipfile.ZipFile(bundle_path, 'w', zipfile.ZIP_DEFLATED) as bundle_zip:
-            # Add fonts if requested
-            if include_fonts:
-                font_assets = self._get_style_fonts(style_name)
-                for font_asset in font_assets:
-                    if os.path.exists(font_asset['path']):
-                        bundle_zip.write(font_asset['path'], f"fonts/{font_asset['filename']}")
-                        manifest['assets']['fonts'].append(font_asset)
-            
-            # Add color schemes if requested
-            if include_color_schemes:
-                color_assets = self._get_style_color_schemes(style_name)
-                for color_asset in color_assets:
-                    if os.path.exists(color_asset['path']):
-                        bundle_zip.write(color_asset['path'], f"color_schemes/{color_asset['filename']}")
-                        manifest['assets']['color_schemes'].append(color_asset)
-            
-            # Add templates if requested
-            if include_templates:
-                template_assets = self._get_style_templates(style_name)
-                for template_asset in template_assets:
-                    if os.path.exists(template_asset['path']):
-                        bundle_zip.write(template_asset['path'], f"templates/{template_asset['filename']}")
-                        manifest['assets']['templates'].append(template_asset)
+        asset_sources = [
+            ('fonts', bundle_config.get('include_fonts', True), self._get_style_fonts),
+            ('color_schemes', bundle_config.get('include_color_schemes', True), self._get_style_color_schemes),
+            ('templates', bundle_config.get('include_templates', True), self._get_style_templates)
+        ]
+        # Style assets share a few directories, so list each one once
+        # instead of checking every path separately
+        listing_cache = {}
+        for asset_type, included, get_style_assets in asset_sources:
+            if included:
+                for asset in get_style_assets(style_name):
+                    directory, filename = os.path.split(asset['path'])
+                    if filename in self._list_files(directory or '.', listing_cache):
+                        manifest['assets'][asset_type].append(dict(asset))
+        
+        return manifest
+    
+    def _stream_bundle_chunks(self, manifest: Dict[str, Any]) -> Iterator[bytes]:
+        """Yield bundle bytes and register the bundle once fully streamed"""
+        checksum = self._new_checksum()
+        bundle_size = 0
+        for chunk in self._iter_bundle_chunks(manifest, checksum):
+            bundle_size += len(chunk)
+            yield chunk
+        
+        self._register_bundle(manifest, None, bundle_size, checksum.hexdigest())
+    
+    def _iter_bundle_chunks(self, manifest: Dict[str, Any], checksum) -> Iterator[bytes]:
+        """Yield ZIP archive bytes for a bundle manifest as they are produced"""
+        stream = _ZipStreamWriter()
+        # Asset files are read into one reused buffer rather than a new bytes object per block
+        buffer = bytearray(_COPY_BLOCK_SIZE)
+        buffer_view = memoryview(buffer)
+        
+        with zipfile.ZipFile(stream, 'w', zipfile.ZIP_DEFLATED, compresslevel=_DEFLATE_LEVEL) as bundle_zip:
+            for asset_type, assets in manifest['assets'].items():
+                for asset in assets:
+                    with open(asset['path'], 'rb') as source:
+                        zip_info = self._member_info(source, f"{asset_type}/{asset['filename']}")
+                        with bundle_zip.open(zip_info, 'w') as member:
+                            while True:
+                                read_size = source.readinto(buffer)
+                                if not read_size:
+                                    break
+                                member.write(buffer_view[:read_size])
+                                yield from self._drain_stream(stream, checksum, _STREAM_CHUNK_SIZE)
             
-            # Add manifest
-            manifest_json = json.dumps(manifest, indent=2)
-            bundle_zip.writestr('manifest.json', manifest_json)
-        
-        # Calculate bundle size and checksum
-        bundle_size = os.path.getsize(bundle_path)
-        bundle_checksum = self._calculate_file_checksum(bundle_path)
-        
-        # Update asset registry
-        self.asset_registry['bundles'][bundle_id] = {
-            'bundle_name': bundle_name,
-            'style': style_name,
+            # Encode the manifest block by block rather than as one large string
+            manifest_info = zipfile.ZipInfo('manifest.json', time.localtime()[:6])
+            manifest_info.external_attr = 0o600 << 16
+            manifest_info.compress_type = zipfile.ZIP_DEFLATED
+            manifest_info._compresslevel = _DEFLATE_LEVEL
+            with bundle_zip.open(manifest_info, 'w') as member:
+                for block in self._iter_json_blocks(manifest):
+                    member.write(block)
+                    yield from self._drain_stream(stream, checksum)
+        
+        # Closing the archive writes the central directory
+        yield from self._drain_stream(stream, checksum)
+    
+    def _iter_json_blocks(self, data: Dict[str, Any]) -> Iterator[bytes]:
+        """Encode data as indented JSON in blocks of roughly one stream chunk"""
+        fragments = []
+        pending_size = 0
+        for fragment in _MANIFEST_ENCODER.iterencode(data):
+            fragments.append(fragment)
+            pending_size += len(fragment)
+            if pending_size >= _STREAM_CHUNK_SIZE:
+                yield ''.join(fragments).encode()
+                fragments.clear()
+                pending_size = 0
+        if fragments:
+            yield ''.join(fragments).encode()
+    
+    def _member_info(self, source, arcname: str) -> zipfile.ZipInfo:
+        """Build ZIP member header from an open asset file"""
+        # fstat on the open descriptor avoids another path lookup
+        file_stat = os.fstat(source.fileno())
+        zip_info = zipfile.ZipInfo(arcname, time.localtime(file_stat.st_mtime)[:6])
+        zip_info.external_attr = (file_stat.st_mode & 0xFFFF) << 16
+        zip_info.file_size = file_stat.st_size
+        zip_info.compress_type = self._member_compression(source.name)
+        # ZipFile.open does not apply the archive's compresslevel to a caller-built ZipInfo
+        zip_info._compresslevel = _DEFLATE_LEVEL
+        return zip_info
+    
+    def _member_compression(self, path: str) -> int:
+        """Choose ZIP compression method for a bundle member"""
+        if os.path.splitext(path)[1].lower() in _PRECOMPRESSED_EXTENSIONS:
+            return zipfile.ZIP_STORED
+        return zipfile.ZIP_DEFLATED
+    
+    def _drain_stream(self, stream: _ZipStreamWriter, checksum,
+                      min_size: int = 0) -> Iterator[bytes]:
+        """Yield pending ZIP output once min_size bytes are buffered, updating the running checksum"""
+        if stream.pending() < max(min_size, 1):
+            return
+        chunk = stream.drain()
+        checksum.update(chunk)
+        yield chunk
+    
+    def _register_bundle(self, manifest: Dict[str, Any], bundle_path: Optional[str],
+                         bundle_size: int, bundle_checksum: str):
+        """Record bundle in the asset registry"""
+        bundle_info = {
+            'bundle_name': manifest['bundle_name'],
+            'style': manifest['style'],
             'path': bundle_path,
             'size': bundle_size,
             'checksum': bundle_checksum,
@@ -119,90 +362,24 @@ class AssetManager:
             'manifest': manifest
         }
         
-        return {
-            'success': True,
-            'bundle_id': bundle_id,
-            'bundle_name': bundle_name,
-            'style': style_name,
-            'bundle_path': bundle_path,
-            'bundle_size': bundle_size,
-            'checksum': bundle_checksum,
-            'asset_count': {
-                'fonts': len(manifest['assets']['fonts']),
-                'color_schemes': len(manifest['assets']['color_schemes']),
-                'templates': len(manifest['assets']['templates'])
-            },
-            'download_url': f'/api/bundles/{bundle_id}/download',
-            'timestamp': self._get_timestamp()
-        }
+        bundles = self.asset_registry['bundles']
+        with self._bundles_lock:
+            bundles[manifest['bundle_id']] = bundle_info
+            while len(bundles) > _BUNDLE_REGISTRY_LIMIT:
+                bundles.popitem(last=False)
     
-    def _get_style_fonts(self, style_name: str) -> List[Dict[str, Any]]:
+    def _get_style_fonts(self, style_name: str) -> Tuple[Mapping[str, Any], ...]:
         """Get fonts for specific style"""
         # Mock implementation - would be based on style configuration
-        default_fonts = [
-            {
-                'name': 'Times New Roman',
-                'filename': 'times-new-roman.ttf',
-                'path': 'fonts/times-new-roman.ttf',
-                'type': 'serif',
-                'weight': 'normal'
-            },
-            {
-                'name': 'Arial',
-                'filename': 'arial.ttf',
-                'path': 'fonts/arial.ttf',
-                'type': 'sans-serif',
-                'weight': 'normal'
-            }
-        ]
-        
-        # Style-specific font mappings
-        style_fonts = {
-            'ieee': [default_fonts[0]],  # Times New Roman
-            'nature': [default_fonts[0]],  # Times New Roman
-            'apa': [default_fonts[0]],  # Times New Roman
-            'modern': [default_fonts[1]]  # Arial
-        }
-        
-        return style_fonts.get(style_name, default_fonts)
+        return _STYLE_FONTS.get(style_name, _DEFAULT_STYLE_FONTS)
     
-    def _get_style_color_schemes(self, style_name: str) -> List[Dict[str, Any]]:
+    def _get_style_color_schemes(self, style_name: str) -> Tuple[Mapping[str, Any], ...]:
         """Get color schemes for specific style"""
-        default_schemes = [
-            {
-                'name': 'Academic',
-                'filename': 'academic.json',
-                'path': 'color_schemes/academic.json',
-                'type': 'professional'
-            },
-            {
-                'name': 'Modern Blue',
-                'filename': 'modern_blue.json',
-                'path': 'color_schemes/modern_blue.json',
-                'type': 'contemporary'
-            }
-        ]
-        
-        return default_schemes
+        return _DEFAULT_STYLE_COLOR_SCHEMES
     
-    def _get_style_templates(self, style_name: str) -> List[Dict[str, Any]]:
+    def _get_style_templates(self, style_name: str) -> Tuple[Mapping[str, Any], ...]:
         """Get templates for specific style"""
-        style_templates = [
-            {
-                'name': f'{style_name.upper()} Article Template',
-                'filename': f'{style_name}_article.html',
-                'path': f'templates/{style_name}_article.html',
-                'type': 'article'
-            },
-            {
-                'name': f'{style_name.upper()} CSS',
-                'filename': f'{style_name}.css',
-                'path': f'templates/{style_name}.css',
-                'type': 'stylesheet'
-            }
-        ]
-        
-        return style_templates
+        return _style_templates(style_name)
     
     def validate_assets(self, asset_config: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -222,9 +399,12 @@ class AssetManager:
             'timestamp': self._get_timestamp()
         }
         
+        # Assets referenced more than once are only stat'ed once
+        stat_cache = {}
+        
         # Validate fonts
         if 'fonts' in asset_config:
-            font_validation = self._validate_fonts(asset_config['fonts'])
+            font_validation = self._validate_fonts(asset_config['fonts'], stat_cache)
             validation_result['asset_checks']['fonts'] = font_validation
             if not font_validation['valid']:
                 validation_result['valid'] = False
@@ -232,7 +412,7 @@ class AssetManager:
         
         # Validate color schemes
         if 'color_schemes' in asset_config:
-            color_validation = self._validate_color_schemes(asset_config['color_schemes'])
+            color_validation = self._validate_color_schemes(asset_config['color_schemes'], stat_cache)
             validation_result['asset_checks']['color_schemes'] = color_validation
             if not color_validation['valid']:
                 validation_result['valid'] = False
@@ -240,7 +420,7 @@ class AssetManager:
         
         # Validate templates
         if 'templates' in asset_config:
-            template_validation = self._validate_templates(asset_config['templates'])
+            template_validation = self._validate_templates(asset_config['templates'], stat_cache)
             validation_result['asset_checks']['templates'] = template_validation
             if not template_validation['valid']:
                 validation_result['valid'] = False
@@ -254,7 +434,8 @@ class AssetManager:
         
         return validation_result
     
-    def _validate_fonts(self, fonts: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _validate_fonts(self, fonts: List[Dict[str, Any]],
+                        stat_cache: Dict[str, Optional[os.stat_result]]) -> Dict[str, Any]:
         """Validate font assets"""
         validation = {
             'valid': True,
@@ -262,33 +443,41 @@ class AssetManager:
             'checked_fonts': []
         }
         
-        for font in fonts:
-            font_check = {
-                'name': font.get('name', 'Unknown'),
-                'exists': False,
-                'valid_format': False,
-                'size': 0
-            }
-            
-            if 'path' in font and os.path.exists(font['path']):
-                font_check['exists'] = True
-                font_check['size'] = os.path.getsize(font['path'])
-                
-                # Check file format
-                if font['path'].lower().endswith(('.ttf', '.otf', '.woff', '.woff2')):
-                    font_check['valid_format'] = True
-                else:
-                    validation['errors'].append(f"Invalid font format: {font['path']}")
-                    validation['valid'] = False
-            else:
-                validation['errors'].append(f"Font file not found: {font.get('path', 'No path specified')}")
+        for font_check, error, valid in self._run_asset_checks(self._check_font, fonts, stat_cache):
+            if error:
+                validation['errors'].append(error)
+            if not valid:
                 validation['valid'] = False
-            
             validation['checked_fonts'].append(font_check)
         
         return validation
     
-    def _validate_color_schemes(self, color_schemes: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _check_font(self, font: Dict[str, Any],
+                    stat_cache: Dict[str, Optional[os.stat_result]]) -> Tuple[Dict[str, Any], Optional[str], bool]:
+        """Check single font asset, returning the check, any error and validity"""
+        font_check = {
+            'name': font.get('name', 'Unknown'),
+            'exists': False,
+            'valid_format': False,
+            'size': 0
+        }
+        
+        font_stat = self._stat(font['path'], stat_cache) if 'path' in font else None
+        if font_stat is None:
+            return font_check, f"Font file not found: {font.get('path', 'No path specified')}", False
+        
+        font_check['exists'] = True
+        font_check['size'] = font_stat.st_size
+        
+        # Check file format
+        if os.path.splitext(font['path'])[1].lower() not in _FONT_EXTENSIONS:
+            return font_check, f"Invalid font format: {font['path']}", False
+        
+        font_check['valid_format'] = True
+        return font_check, None, True
+    
+    def _validate_color_schemes(self, color_schemes: List[Dict[str, Any]],
+                                stat_cache: Dict[str, Optional[os.stat_result]]) -> Dict[str, Any]:
         """Validate color scheme assets"""
         validation = {
             'valid': True,
@@ -296,34 +485,42 @@ class AssetManager:
             'checked_schemes': []
         }
         
-        for scheme in color_schemes:
-            scheme_check = {
-                'name': scheme.get('name', 'Unknown'),
-                'exists': False,
-                'valid_json': False,
-                'color_count': 0
-            }
-            
-            if 'path' in scheme and os.path.exists(scheme['path']):
-                scheme_check['exists'] = True
-                
-                try:
-                    with open(scheme['path'], 'r') as f:
-                        scheme_data = json.load(f)
-                        scheme_check['valid_json'] = True
-                        scheme_check['color_count'] = len(scheme_data.get('colors', {}))
-                except json.JSONDecodeError:
-                    validation['errors'].append(f"Invalid JSON in color scheme: {scheme['path']}")
-                    validation['valid'] = False
-            else:
-                validation['errors'].append(f"Color scheme file not found: {scheme.get('path', 'No path specified')}")
+        for scheme_check, error, valid in self._run_asset_checks(self._check_color_scheme, color_schemes, stat_cache):
+            if error:
+                validation['errors'].append(error)
+            if not valid:
                 validation['valid'] = False
-            
             validation['checked_schemes'].append(scheme_check)
         
         return validation
     
-    def _validate_templates(self, templates: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _check_color_scheme(self, scheme: Dict[str, Any],
+                            stat_cache: Dict[str, Optional[os.stat_result]]) -> Tuple[Dict[str, Any], Optional[str], bool]:
+        """Check single color scheme asset, returning the check, any error and validity"""
+        scheme_check = {
+            'name': scheme.get('name', 'Unknown'),
+            'exists': False,
+            'valid_json': False,
+            'color_count': 0
+        }
+        
+        if 'path' not in scheme or self._stat(scheme['path'], stat_cache) is None:
+            return scheme_check, f"Color scheme file not found: {scheme.get('path', 'No path specified')}", False
+        
+        scheme_check['exists'] = True
+        
+        try:
+            with self._io_sem, open(scheme['path'], 'rb') as f:
+                scheme_data = json.loads(f.read())
+                scheme_check['valid_json'] = True
+                scheme_check['color_count'] = len(scheme_data.get('colors', {}))
+        except json.JSONDecodeError:
+            return scheme_check, f"Invalid JSON in color scheme: {scheme['path']}", False
+        
+        return scheme_check, None, True
+    
+    def _validate_templates(self, templates: List[Dict[str, Any]],
+                            stat_cache: Dict[str, Optional[os.stat_result]]) -> Dict[str, Any]:
         """Validate template assets"""
         validation = {
             'valid': True,
@@ -331,32 +528,80 @@ class AssetManager:
             'checked_templates': []
         }
         
-        for template in templates:
-            template_check = {
-                'name': template.get('name', 'Unknown'),
-                'exists': False,
-                'valid_format': False,
-                'size': 0
-            }
-            
-            if 'path' in template and os.path.exists(template['path']):
-                template_check['exists'] = True
-                template_check['size'] = os.path.getsize(template['path'])
-                
-                # Check file format
-                if template['path'].lower().endswith(('.html', '.css', '.js', '.tex', '.md')):
-                    template_check['valid_format'] = True
-                else:
-                    validation['errors'].append(f"Unknown template format: {template['path']}")
-                    # Don't mark as invalid for unknown formats, just warn
-            else:
-                validation['errors'].append(f"Template file not found: {template.get('path', 'No path specified')}")
+        for template_check, error, valid in self._run_asset_checks(self._check_template, templates, stat_cache):
+            if error:
+                validation['errors'].append(error)
+            if not valid:
                 validation['valid'] = False
-            
             validation['checked_templates'].append(template_check)
         
         return validation
     
+    def _check_template(self, template: Dict[str, Any],
+                        stat_cache: Dict[str, Optional[os.stat_result]]) -> Tuple[Dict[str, Any], Optional[str], bool]:
+        """Check single template asset, returning the check, any error and validity"""
+        template_check = {
+            'name': template.get('name', 'Unknown'),
+            'exists': False,
+            'valid_format': False,
+            'size': 0
+        }
+        
+        template_stat = self._stat(template['path'], stat_cache) if 'path' in template else None
+        if template_stat is None:
+            return template_check, f"Template file not found: {template.get('path', 'No path specified')}", False
+        
+        template_check['exists'] = True
+        template_check['size'] = template_stat.st_size
+        
+        # Check file format
+        if os.path.splitext(template['path'])[1].lower() not in _TEMPLATE_EXTENSIONS:
+            # Don't mark as invalid for unknown formats, just warn
+            return template_check, f"Unknown template format: {template['path']}", True
+        
+        template_check['valid_format'] = True
+        return template_check, None, True
+    
+    def _run_asset_checks(self, check, assets: List[Dict[str, Any]],
+                          stat_cache: Dict[str, Optional[os.stat_result]]) -> List[Tuple[Dict[str, Any], Optional[str], bool]]:
+        """Run per-asset checks, spreading large groups over the shared thread pool in input order"""
+        if len(assets) <= _VALIDATION_BATCH_SIZE:
+            return [check(asset, stat_cache) for asset in assets]
+        
+        batches = [
+            assets[start:start + _VALIDATION_BATCH_SIZE]
+            for start in range(0, len(assets), _VALIDATION_BATCH_SIZE)
+        ]
+        results = []
+        for batch_results in self._executor.map(
+                lambda batch: [check(asset, stat_cache) for asset in batch], batches):
+            results.extend(batch_results)
+        return results
+    
+    def _stat(self, path: str,
+              stat_cache: Dict[str, Optional[os.stat_result]]) -> Optional[os.stat_result]:
+        """Stat path once per call, returning None if it does not exist"""
+        if path not in stat_cache:
+            try:
+                with self._io_sem:
+                    stat_cache[path] = os.stat(path)
+            except (OSError, ValueError):
+                stat_cache[path] = None
+        return stat_cache[path]
+    
+    def _list_files(self, directory: str,
+                    listing_cache: Dict[str, frozenset]) -> frozenset:
+        """List file names in directory once per call"""
+        if directory not in listing_cache:
+            try:
+                with self._io_sem, os.scandir(directory) as entries:
+                    listing_cache[directory] = frozenset(
+                        entry.name for entry in entries if entry.is_file()
+                    )
+            except OSError:
+                listing_cache[directory] = frozenset()
+        return listing_cache[directory]
+    
     def _check_asset_compatibility(self, asset_config: Dict[str, Any]) -> Dict[str, Any]:
         """Check compatibility between different assets"""
         compatibility = {
@@ -400,23 +645,30 @@ class AssetManager:
             'timestamp': self._get_timestamp()
         }
         
-        for service in target_services:
-            try:
-                service_sync_result = self._sync_with_service(service, sync_type)
+        if target_services:
+            # Contact all services concurrently; results are collected in request order
+            futures = [
+                self._executor.submit(self._sync_with_service, service, sync_type)
+                for service in target_services
+            ]
+            
+            for service, future in zip(target_services, futures):
+                try:
+                    service_sync_result = future.result()
+                    
+                    if service_sync_result['success']:
+                        sync_result['synced_services'].append(service)
+                    else:
+                        sync_result['failed_services'].append({
+                            'service': service,
+                            'error': service_sync_result.get('error', 'Unknown error')
+                        })
                 
-                if service_sync_result['success']:
-                    sync_result['synced_services'].append(service)
-                else:
+                except Exception as e:
                     sync_result['failed_services'].append({
                         'service': service,
-                        'error': service_sync_result.get('error', 'Unknown error')
+                        'error': str(e)
                     })
-            
-            except Exception as e:
-                sync_result['failed_services'].append({
-                    'service': service,
-                    'error': str(e)
-                })
         
         # Update sync summary
         sync_result['sync_summary'] = {
@@ -458,15 +710,11 @@ class AssetManager:
     def _generate_bundle_id(self, bundle_name: str, style_name: str) -> str:
         """Generate unique bundle ID"""
         base_string = f"{bundle_name}_{style_name}_{self._get_timestamp()}"
-        return hashlib.md5(base_string.encode()).hexdigest()[:12]
-    
-    def _calculate_file_checksum(self, file_path: str) -> str:
-        """Calculate file checksum"""
-        hash_md5 = hashlib.md5()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
+        return hashlib.blake2b(base_string.encode(), digest_size=6).hexdigest()
+    
+    def _new_checksum(self):
+        """Create hasher for bundle checksums"""
+        return hashlib.blake2b(digest_size=32)
     
     def _get_timestamp(self) -> str:
         """Get current timestamp"""
@@ -4,9 +4,272 @@ Manages color schemes for different publication styles
 """
 
 import os
+import re
 import json
-from typing import Dict, List, Any, Optional
+import operator
+import threading
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
+
+# Default schemes are shared, read-only data, nested values included; each
+# service registers its own mutable copies (see _copy_default_scheme)
+_DEFAULT_SCHEMES = (
+    MappingProxyType({
+        'name': 'Academic Blue',
+        'category': 'academic',
+        'description': 'Professional blue tones for academic publications',
+        'colors': MappingProxyType({
+            'primary': '#003366',
+            'secondary': '#0066CC',
+            'accent': '#3399FF',
+            'background': '#FFFFFF',
+            'text': '#000000',
+            'text_secondary': '#333333',
+            'border': '#CCCCCC',
+            'highlight': '#FFFF99',
+            'error': '#CC0000',
+            'success': '#006600'
+        }),
+        'usage': 'IEEE papers, technical documents',
+        'compatibility': ('ieee', 'technical'),
+        'accessibility': MappingProxyType({
+            'wcag_aa_compliant': True,
+            'contrast_ratio': 4.5
+        })
+    }),
+    MappingProxyType({
+        'name': 'Nature Green',
+        'category': 'academic',
+        'description': 'Natural green palette for scientific publications',
+        'colors': MappingProxyType({
+            'primary': '#2D5016',
+            'secondary': '#4A7C28',
+            'accent': '#6FA83B',
+            'background': '#FFFFFF',
+            'text': '#000000',
+            'text_secondary': '#2D2D2D',
+            'border': '#B8D4A5',
+            'highlight': '#E8F5E8',
+            'error': '#B71C1C',
+            'success': '#2E7D32'
+        }),
+        'usage': 'Nature journal style, environmental studies',
+        'compatibility': ('nature', 'environmental'),
+        'accessibility': MappingProxyType({
+            'wcag_aa_compliant': True,
+            'contrast_ratio': 4.8
+        })
+    }),
+    MappingProxyType({
+        'name': 'Modern Grayscale',
+        'category': 'modern',
+        'description': 'Clean grayscale palette for contemporary designs',
+        'colors': MappingProxyType({
+            'primary': '#2C2C2C',
+            'secondary': '#4A4A4A',
+            'accent': '#007ACC',
+            'background': '#FFFFFF',
+            'text': '#1A1A1A',
+            'text_secondary': '#666666',
+            'border': '#E0E0E0',
+            'highlight': '#F5F5F5',
+            'error': '#E53E3E',
+            'success': '#38A169'
+        }),
+        'usage': 'Modern documents, presentations',
+        'compatibility': ('modern', 'minimal'),
+        'accessibility': MappingProxyType({
+            'wcag_aa_compliant': True,
+            'contrast_ratio': 7.2
+        })
+    }),
+    MappingProxyType({
+        'name': 'Corporate Blue',
+        'category': 'corporate',
+        'description': 'Professional corporate color scheme',
+        'colors': MappingProxyType({
+            'primary': '#1E3A8A',
+            'secondary': '#3B82F6',
+            'accent': '#60A5FA',
+            'background': '#FFFFFF',
+            'text': '#111827',
+            'text_secondary': '#4B5563',
+            'border': '#D1D5DB',
+            'highlight': '#EBF8FF',
+            'error': '#DC2626',
+            'success': '#059669'
+        }),
+        'usage': 'Business reports, corporate documents',
+        'compatibility': ('corporate', 'business'),
+        'accessibility': MappingProxyType({
+            'wcag_aa_compliant': True,
+            'contrast_ratio': 5.1
+        })
+    }),
+    MappingProxyType({
+        'name': 'Creative Palette',
+        'category': 'creative',
+        'description': 'Vibrant colors for creative projects',
+        'colors': MappingProxyType({
+            'primary': '#7C3AED',
+            'secondary': '#A855F7',
+            'accent': '#C084FC',
+            'background': '#FEFEFE',
+            'text': '#1F2937',
+            'text_secondary': '#374151',
+            'border': '#E5E7EB',
+            'highlight': '#FDF4FF',
+            'error': '#F87171',
+            'success': '#34D399'
+        }),
+        'usage': 'Creative presentations, artistic documents',
+        'compatibility': ('creative', 'artistic'),
+        'accessibility': MappingProxyType({
+            'wcag_aa_compliant': False,
+            'contrast_ratio': 3.8
+        })
+    })
+)
+
+def _copy_default_scheme(scheme_data: MappingProxyType) -> Dict[str, Any]:
+    """Copy a default scheme into plain dicts and lists it can own and serialize"""
+    return {
+        **scheme_data,
+        'colors': dict(scheme_data['colors']),
+        'compatibility': list(scheme_data['compatibility']),
+        'accessibility': dict(scheme_data['accessibility'])
+    }
+
+# Fields listed for each scheme by get_schemes_by_category
+_CATEGORY_LISTING_FIELDS = operator.attrgetter('name', 'description', 'colors', 'usage')
+
+# Common #RRGGBB form, checked before the full pattern
+_HEX_COLOR_RE = re.compile(r'#[A-Fa-f0-9]{6}')
+
+# Accepted color formats: #RGB/#RRGGBB hex, rgb() and rgba()
+_COLOR_RE = re.compile(
+    r'^(?:#(?:[A-Fa-f0-9]{6}|[A-Fa-f0-9]{3})'
+    r'|rgb\(\s*\d+\s*,\s*\d+\s*,\s*\d+\s*\)'
+    r'|rgba\(\s*\d+\s*,\s*\d+\s*,\s*\d+\s*,\s*[\d.]+\s*\))$'
+)
+
+# Generated CSS depends only on a scheme's colors, so it is cached by their
+# (name, value) pairs; the complete theme's per-request header is added by the caller
+@lru_cache(maxsize=256)
+def _css_variables(color_items: Tuple[Tuple[str, str], ...]) -> str:
+    """Generate CSS variables"""
+    variables = ''.join(
+        f'\n  --color-{color_name.replace("_", "-")}: {color_value};'
+        for color_name, color_value in color_items
+    )
+    return f':root {{{variables}\n}}'
+
+@lru_cache(maxsize=256)
+def _css_classes(color_items: Tuple[Tuple[str, str], ...]) -> str:
+    """Generate CSS classes for colors"""
+    css_blocks = []
+    
+    for color_name, color_value in color_items:
+        class_name = color_name.replace('_', '-')
+        
+        # Background, text and border color classes
+        css_blocks.append(
+            f'.bg-{class_name} {{\n'
+            f'  background-color: {color_value};\n'
+            f'}}\n'
+            f'\n'
+            f'.text-{class_name} {{\n'
+            f'  color: {color_value};\n'
+            f'}}\n'
+            f'\n'
+            f'.border-{class_name} {{\n'
+            f'  border-color: {color_value};\n'
+            f'}}\n'
+        )
+    
+    return '\n'.join(css_blocks)
+
+@lru_cache(maxsize=256)
+def _css_theme(color_items: Tuple[Tuple[str, str], ...]) -> str:
+    """Generate complete CSS theme body"""
+    colors = dict(color_items)
+    return (
+        f'{_css_variables(color_items)}\n'
+        f'\n'
+        f'{_css_classes(color_items)}\n'
+        f'\n'
+        f'/* Base styling */\n'
+        f'body {{\n'
+        f'  background-color: {colors.get("background", "#FFFFFF")};\n'
+        f'  color: {colors.get("text", "#000000")};\n'
+        f'}}\n'
+        f'\n'
+        f'h1, h2, h3, h4, h5, h6 {{\n'
+        f'  color: {colors.get("primary", "#000000")};\n'
+        f'}}\n'
+        f'\n'
+        f'a {{\n'
+        f'  color: {colors.get("accent", "#0066CC")};\n'
+        f'}}\n'
+        f'\n'
+        f'a:hover {{\n'
+        f'  color: {colors.get("secondary", "#003366")};\n'
+        f'}}\n'
+        f'\n'
+        f'.highlight {{\n'
+        f'  background-color: {colors.get("highlight", "#FFFF99")};\n'
+        f'}}\n'
+        f'\n'
+        f'.error {{\n'
+        f'  color: {colors.get("error", "#CC0000")};\n'
+        f'}}\n'
+        f'\n'
+        f'.success {{\n'
+        f'  color: {colors.get("success", "#006600")};\n'
+        f'}}'
+    )
+
+@dataclass(frozen=True)
+class ColorScheme:
+    """Registered color scheme; usage counts are kept by the service"""
+    
+    # Fixed attribute slots keep each record smaller than the equivalent dict
+    __slots__ = (
+        'id', 'name', 'category', 'description', 'colors', 'usage',
+        'compatibility', 'accessibility', 'created', 'status'
+    )
+    
+    id: str
+    name: str
+    category: str
+    description: str
+    colors: Dict[str, str]
+    usage: str
+    compatibility: List[str]
+    accessibility: Dict[str, Any]
+    created: str
+    status: str
+    
+    def to_dict(self, usage_count: int = 0, **extra: Any) -> Dict[str, Any]:
+        """Convert record to a plain dict for responses and files, adding any extra fields"""
+        return {
+            'id': self.id,
+            'name': self.name,
+            'category': self.category,
+            'description': self.description,
+            'colors': self.colors,
+            'usage': self.usage,
+            'compatibility': self.compatibility,
+            'accessibility': self.accessibility,
+            'created': self.created,
+            'status': self.status,
+            'usage_count': usage_count,
+            **extra
+        }
 
 class ColorSchemeService:
     """Service for managing color schemes"""
@@ -15,7 +278,23 @@ class ColorSchemeService:
         self.schemes_directory = 'color_schemes'
         self._ensure_schemes_directory()
         self.scheme_registry = self._initialize_scheme_registry()
-        self._create_default_schemes()
+        # Scheme IDs for each compatibility tag, in registration order
+        self._compat_index = defaultdict(list)
+        # Scheme ID for each registered scheme's name and ID, so lookups by
+        # either skip rebuilding the ID
+        self._name_to_id: Dict[str, str] = {}
+        # Access counts live apart from the read-only scheme records
+        self._usage = Counter()
+        self._usage_lock = threading.Lock()
+        # Registrations run one at a time and bump the version when done
+        self._register_lock = threading.Lock()
+        self._registry_version = 0
+        # Registry version, scheme list and category counts served by
+        # get_available_schemes, rebuilt once the version moves on
+        self._available_cache: Optional[Tuple[int, List[Dict[str, Any]], Dict[str, int]]] = None
+        # Default schemes are written and registered on first use
+        self._defaults_loaded = False
+        self._defaults_lock = threading.Lock()
     
     def _ensure_schemes_directory(self):
         """Ensure color schemes directory exists"""
@@ -37,177 +316,95 @@ class ColorSchemeService:
             }
         }
     
+    def _ensure_default_schemes(self):
+        """Create default color schemes if they have not been created yet"""
+        if self._defaults_loaded:
+            return
+        with self._defaults_lock:
+            if not self._defaults_loaded:
+                self._create_default_schemes()
+                self._defaults_loaded = True
+    
     def _create_default_schemes(self):
         """Create default color schemes"""
-        default_schemes = [
-            {
-                'name': 'Academic Blue',
-                'category': 'academic',
-                'description': 'Professional blue tones for academic publications',
-                'colors': {
-                    'primary': '#003366',
-                    'secondary': '#0066CC',
-                    'accent': '#3399FF',
-                    'background': '#FFFFFF',
-                    'text': '#000000',
-                    'text_secondary': '#333333',
-                    'border': '#CCCCCC',
-                    'highlight': '#FFFF99',
-                    'error': '#CC0000',
-                    'success': '#006600'
-                },
-                'usage': 'IEEE papers, technical documents',
-                'compatibility': ['ieee', 'technical'],
-                'accessibility': {
-                    'wcag_aa_compliant': True,
-                    'contrast_ratio': 4.5
-                }
-            },
-            {
-                'name': 'Nature Green',
-                'category': 'academic',
-                'description': 'Natural green palette for scientific publications',
-                'colors': {
-                    'primary': '#2D5016',
-                    'secondary': '#4A7C28',
-                    'accent': '#6FA83B',
-                    'background': '#FFFFFF',
-                    'text': '#000000',
-                    'text_secondary': '#2D2D2D',
-                    'border': '#B8D4A5',
-                    'highlight': '#E8F5E8',
-                    'error': '#B71C1C',
-                    'success': '#2E7D32'
-                },
-                'usage': 'Nature journal style, environmental studies',
-                'compatibility': ['nature', 'environmental'],
-                'accessibility': {
-                    'wcag_aa_compliant': True,
-                    'contrast_ratio': 4.8
-                }
-            },
-            {
-                'name': 'Modern Grayscale',
-                'category': 'modern',
-                'description': 'Clean grayscale palette for contemporary designs',
-                'colors': {
-                    'primary': '#2C2C2C',
-                    'secondary': '#4A4A4A',
-                    'accent': '#007ACC',
-                    'background': '#FFFFFF',
-                    'text': '#1A1A1A',
-                    'text_secondary': '#666666',
-                    'border': '#E0E0E0',
-                    'highlight': '#F5F5F5',
-                    'error': '#E53E3E',
-                    'success': '#38A169'
-                },
-                'usage': 'Modern documents, presentations',
-                'compatibility': ['modern', 'minimal'],
-                'accessibility': {
-                    'wcag_aa_compliant': True,
-                    'contrast_ratio': 7.2
-                }
-            },
-            {
-                'name': 'Corporate Blue',
-                'category': 'corporate',
-                'description': 'Professional corporate color scheme',
-                'colors': {
-                    'primary': '#1E3A8A',
-                    'secondary': '#3B82F6',
-                    'accent': '#60A5FA',
-                    'background': '#FFFFFF',
-                    'text': '#111827',
-                    'text_secondary': '#4B5563',
-                    'border': '#D1D5DB',
-                    'highlight': '#EBF8FF',
-                    'error': '#DC2626',
-                    'success': '#059669'
-                },
-                'usage': 'Business reports, corporate documents',
-                'compatibility': ['corporate', 'business'],
-                'accessibility': {
-                    'wcag_aa_compliant': True,
-                    'contrast_ratio': 5.1
-                }
-            },
-            {
-                'name': 'Creative Palette',
-                'category': 'creative',
-                'description': 'Vibrant colors for creative projects',
-                'colors': {
-                    'primary': '#7C3AED',
-                    'secondary': '#A855F7',
-                    'accent': '#C084FC',
-                    'background': '#FEFEFE',
-                    'text': '#1F2937',
-                    'text_secondary': '#374151',
-                    'border': '#E5E7EB',
-                    'highlight': '#FDF4FF',
-                    'error': '#F87171',
-                    'success': '#34D399'
-                },
-                'usage': 'Creative presentations, artistic documents',
-                'compatibility': ['creative', 'artistic'],
-                'accessibility': {
-                    'wcag_aa_compliant': False,
-                    'contrast_ratio': 3.8
-                }
-            }
-        ]
-        
-        for scheme_data in default_schemes:
+        timestamp = self._get_timestamp()
+        for default_scheme in _DEFAULT_SCHEMES:
+            scheme_data = _copy_default_scheme(default_scheme)
             self._save_scheme_to_file(scheme_data)
             scheme_id = self._generate_scheme_id(scheme_data['name'])
             
-            self.scheme_registry['schemes'][scheme_id] = {
+            self._register_scheme(ColorScheme(
                 **scheme_data,
-                'id': scheme_id,
-                'created': self._get_timestamp(),
-                'status': 'active',
-                'usage_count': 0
-            }
+                id=scheme_id,
+                created=timestamp,
+                status='active'
+            ))
+        
+        # Update metadata
+        self.scheme_registry['metadata']['total_schemes'] = len(self.scheme_registry['schemes'])
+        self.scheme_registry['metadata']['last_updated'] = timestamp
+    
+    def _register_scheme(self, scheme: ColorScheme):
+        """Add scheme to the registry, its category and the compatibility index"""
+        # Collect the distinct compatibility tags first, so a scheme with
+        # unusable tags is rejected before any index is touched
+        style_names = dict.fromkeys(scheme.compatibility)
+        
+        with self._register_lock:
+            scheme_id = scheme.id
+            self.scheme_registry['schemes'][scheme_id] = scheme
+            self._name_to_id[scheme.name] = scheme_id
+            self._name_to_id[scheme_id] = scheme_id
+            with self._usage_lock:
+                # Start at zero so ties in most_common keep registration order
+                self._usage[scheme_id] = 0
             
             # Add to category
-            category = scheme_data['category']
+            category = scheme.category
             if category in self.scheme_registry['categories']:
                 self.scheme_registry['categories'][category].append(scheme_id)
-        
-        # Update metadata
-        self.scheme_registry['metadata']['total_schemes'] = len(self.scheme_registry['schemes'])
-        self.scheme_registry['metadata']['last_updated'] = self._get_timestamp()
+            else:
+                self.scheme_registry['categories'][category] = [scheme_id]
+            
+            # Index each distinct compatibility tag once
+            for style_name in style_names:
+                self._compat_index[style_name].append(scheme_id)
+            
+            # Listings built before this point no longer match the registry
+            self._registry_version += 1
     
     def _save_scheme_to_file(self, scheme_data: Dict[str, Any]):
         """Save color scheme to JSON file"""
         filename = f"{scheme_data['name'].lower().replace(' ', '_')}.json"
         file_path = os.path.join(self.schemes_directory, filename)
         
-        with open(file_path, 'w') as f:
-            json.dump(scheme_data, f, indent=2)
+        # Encode up front so the file gets one write instead of one per JSON token
+        scheme_json = json.dumps(scheme_data, indent=2).encode()
+        if self._file_matches(file_path, scheme_json):
+            return
+        
+        with open(file_path, 'wb') as f:
+            f.write(scheme_json)
+    
+    def _file_matches(self, file_path: str, content: bytes) -> bool:
+        """Check whether file already holds exactly this content"""
+        try:
+            if os.stat(file_path).st_size != len(content):
+                return False
+            with open(file_path, 'rb') as f:
+                return f.read() == content
+        except OSError:
+            return False
     
     def get_available_schemes(self) -> Dict[str, Any]:
         """Get list of available color schemes"""
-        schemes_list = []
+        self._ensure_default_schemes()
         
-        for scheme_id, scheme_info in self.scheme_registry['schemes'].items():
-            schemes_list.append({
-                'id': scheme_id,
-                'name': scheme_info['name'],
-                'category': scheme_info['category'],
-                'description': scheme_info['description'],
-                'usage': scheme_info['usage'],
-                'compatibility': scheme_info['compatibility'],
-                'accessibility': scheme_info['accessibility'],
-                'status': scheme_info['status']
-            })
+        schemes_list, category_counts = self._get_available_summary()
         
         return {
             'schemes': schemes_list,
-            'categories': {
-                category: len(scheme_ids) 
-                for category, scheme_ids in self.scheme_registry['categories'].items()
-            },
+            'categories': category_counts,
             'total_schemes': len(schemes_list),
             'metadata': {
                 'timestamp': self._get_timestamp(),
@@ -215,29 +412,63 @@ class ColorSchemeService:
             }
         }
     
+    def _get_available_summary(self) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+        """Get cached scheme list and category counts, building them if needed"""
+        version = self._registry_version
+        available = self._available_cache
+        if available is not None and available[0] == version:
+            return available[1], available[2]
+        
+        schemes_list = []
+        
+        for scheme_id, scheme in self.scheme_registry['schemes'].items():
+            schemes_list.append({
+                'id': scheme_id,
+                'name': scheme.name,
+                'category': scheme.category,
+                'description': scheme.description,
+                'usage': scheme.usage,
+                'compatibility': scheme.compatibility,
+                'accessibility': scheme.accessibility,
+                'status': scheme.status
+            })
+        
+        category_counts = {
+            category: len(scheme_ids) 
+            for category, scheme_ids in self.scheme_registry['categories'].items()
+        }
+        
+        # Tag the result with the version read before building, so a scheme
+        # registered meanwhile makes the next call rebuild
+        self._available_cache = (version, schemes_list, category_counts)
+        return schemes_list, category_counts
+    
     def get_scheme(self, scheme_name: str) -> Optional[Dict[str, Any]]:
         """Get specific color scheme"""
-        scheme_id = self._generate_scheme_id(scheme_name)
+        self._ensure_default_schemes()
         
-        if scheme_id in self.scheme_registry['schemes']:
-            scheme_info = self.scheme_registry['schemes'][scheme_id].copy()
-            
-            # Update usage count
-            self.scheme_registry['schemes'][scheme_id]['usage_count'] += 1
-            
-            # Add metadata
-            scheme_info['metadata'] = {
-                'last_accessed': self._get_timestamp(),
-                'preview_url': f'/api/color-schemes/{scheme_name}/preview',
-                'css_url': f'/api/color-schemes/{scheme_name}/css'
-            }
-            
-            return scheme_info
+        scheme_id = self._name_to_id.get(scheme_name) or self._generate_scheme_id(scheme_name)
         
-        return None
+        scheme = self.scheme_registry['schemes'].get(scheme_id)
+        if scheme is None:
+            return None
+        
+        # Update usage count, reporting the count from before this access
+        with self._usage_lock:
+            usage_count = self._usage[scheme_id]
+            self._usage[scheme_id] = usage_count + 1
+        
+        # Build the response with its metadata in one step
+        return scheme.to_dict(usage_count, metadata={
+            'last_accessed': self._get_timestamp(),
+            'preview_url': f'/api/color-schemes/{scheme_name}/preview',
+            'css_url': f'/api/color-schemes/{scheme_name}/css'
+        })
     
     def create_scheme(self, scheme_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create new color scheme"""
+        self._ensure_default_schemes()
+        
         required_fields = ['name', 'category', 'colors']
         for field in required_fields:
             if field not in scheme_data:
@@ -264,50 +495,51 @@ class ColorSchemeService:
                 'details': color_validation['errors']
             }
         
+        # Treat a missing, null or non-list compatibility as no tags
+        compatibility = scheme_data.get('compatibility')
+        if not isinstance(compatibility, list):
+            compatibility = []
+        
+        timestamp = self._get_timestamp()
+        
         # Add default values
-        scheme_info = {
-            'id': scheme_id,
-            'name': scheme_data['name'],
-            'category': scheme_data['category'],
-            'description': scheme_data.get('description', ''),
-            'colors': scheme_data['colors'],
-            'usage': scheme_data.get('usage', 'General purpose'),
-            'compatibility': scheme_data.get('compatibility', []),
-            'accessibility': scheme_data.get('accessibility', {
+        scheme = ColorScheme(
+            id=scheme_id,
+            name=scheme_data['name'],
+            category=scheme_data['category'],
+            description=scheme_data.get('description', ''),
+            colors=scheme_data['colors'],
+            usage=scheme_data.get('usage', 'General purpose'),
+            compatibility=compatibility,
+            accessibility=scheme_data.get('accessibility', {
                 'wcag_aa_compliant': False,
                 'contrast_ratio': 0
             }),
-            'created': self._get_timestamp(),
-            'status': 'active',
-            'usage_count': 0
-        }
+            created=timestamp,
+            status='active'
+        )
         
         # Save to file
-        self._save_scheme_to_file(scheme_info)
+        self._save_scheme_to_file(scheme.to_dict())
         
         # Register scheme
-        self.scheme_registry['schemes'][scheme_id] = scheme_info
-        
-        # Add to category
-        category = scheme_info['category']
-        if category in self.scheme_registry['categories']:
-            self.scheme_registry['categories'][category].append(scheme_id)
-        else:
-            self.scheme_registry['categories'][category] = [scheme_id]
+        self._register_scheme(scheme)
         
         # Update metadata
         self.scheme_registry['metadata']['total_schemes'] = len(self.scheme_registry['schemes'])
-        self.scheme_registry['metadata']['last_updated'] = self._get_timestamp()
+        self.scheme_registry['metadata']['last_updated'] = timestamp
         
         return {
             'success': True,
             'scheme_id': scheme_id,
             'message': f'Color scheme {scheme_data["name"]} created successfully',
-            'timestamp': self._get_timestamp()
+            'timestamp': timestamp
         }
     
     def get_schemes_by_category(self, category: str) -> Dict[str, Any]:
         """Get color schemes by category"""
+        self._ensure_default_schemes()
+        
         if category not in self.scheme_registry['categories']:
             return {
                 'error': f'Unknown category: {category}',
@@ -317,15 +549,18 @@ class ColorSchemeService:
         scheme_ids = self.scheme_registry['categories'][category]
         schemes = []
         
+        registered = self.scheme_registry['schemes']
+        
         for scheme_id in scheme_ids:
-            if scheme_id in self.scheme_registry['schemes']:
-                scheme_info = self.scheme_registry['schemes'][scheme_id]
+            scheme = registered.get(scheme_id)
+            if scheme is not None:
+                name, description, colors, usage = _CATEGORY_LISTING_FIELDS(scheme)
                 schemes.append({
                     'id': scheme_id,
-                    'name': scheme_info['name'],
-                    'description': scheme_info['description'],
-                    'colors': scheme_info['colors'],
-                    'usage': scheme_info['usage']
+                    'name': name,
+                    'description': description,
+                    'colors': colors,
+                    'usage': usage
                 })
         
         return {
@@ -337,17 +572,19 @@ class ColorSchemeService:
     
     def get_schemes_by_compatibility(self, style_name: str) -> Dict[str, Any]:
         """Get color schemes compatible with specific style"""
+        self._ensure_default_schemes()
+        
         compatible_schemes = []
         
-        for scheme_id, scheme_info in self.scheme_registry['schemes'].items():
-            if style_name in scheme_info.get('compatibility', []):
-                compatible_schemes.append({
-                    'id': scheme_id,
-                    'name': scheme_info['name'],
-                    'category': scheme_info['category'],
-                    'description': scheme_info['description'],
-                    'colors': scheme_info['colors']
-                })
+        for scheme_id in self._compat_index.get(style_name, ()):
+            scheme = self.scheme_registry['schemes'][scheme_id]
+            compatible_schemes.append({
+                'id': scheme_id,
+                'name': scheme.name,
+                'category': scheme.category,
+                'description': scheme.description,
+                'colors': scheme.colors
+            })
         
         return {
             'style': style_name,
@@ -365,15 +602,11 @@ class ColorSchemeService:
                 'error': 'Color scheme not found'
             }
         
-        colors = scheme['colors']
+        # Reuse the lookup's access time for the whole response
+        timestamp = scheme['metadata']['last_accessed']
         
-        if css_format == 'variables':
-            css_content = self._generate_css_variables(colors)
-        elif css_format == 'classes':
-            css_content = self._generate_css_classes(colors)
-        elif css_format == 'complete':
-            css_content = self._generate_complete_css(colors, scheme_name)
-        else:
+        css_chunks = self._generate_css_chunks(scheme['colors'], scheme_name, css_format, timestamp)
+        if css_chunks is None:
             return {
                 'success': False,
                 'error': f'Unknown CSS format: {css_format}'
@@ -383,89 +616,55 @@ class ColorSchemeService:
             'success': True,
             'scheme_name': scheme_name,
             'css_format': css_format,
-            'css_content': css_content,
-            'timestamp': self._get_timestamp()
+            'css_content': ''.join(css_chunks),
+            'timestamp': timestamp
         }
     
-    def _generate_css_variables(self, colors: Dict[str, str]) -> str:
-        """Generate CSS variables"""
-        css_lines = [':root {']
+    def stream_css(self, scheme_name: str, css_format: str = 'complete') -> Optional[Dict[str, Any]]:
+        """Generate CSS from color scheme as chunks to write straight to a response"""
+        scheme = self.get_scheme(scheme_name)
+        if not scheme:
+            return None
         
-        for color_name, color_value in colors.items():
-            css_lines.append(f'  --color-{color_name.replace("_", "-")}: {color_value};')
+        css_chunks = self._generate_css_chunks(
+            scheme['colors'], scheme_name, css_format, scheme['metadata']['last_accessed']
+        )
+        if css_chunks is None:
+            return {
+                'success': False,
+                'error': f'Unknown CSS format: {css_format}'
+            }
         
-        css_lines.append('}')
-        return '\n'.join(css_lines)
+        return {
+            'success': True,
+            'css_format': css_format,
+            'css_chunks': css_chunks
+        }
+    
+    def _generate_css_chunks(self, colors: Dict[str, str], scheme_name: str,
+                             css_format: str, timestamp: str) -> Optional[Tuple[str, ...]]:
+        """Generate CSS in the requested format, or None for an unknown format"""
+        if css_format == 'variables':
+            return (self._generate_css_variables(colors),)
+        if css_format == 'classes':
+            return (self._generate_css_classes(colors),)
+        if css_format == 'complete':
+            # The cached theme body is passed on as is rather than copied behind its header
+            return (
+                f'/* {scheme_name} Color Scheme */\n'
+                f'/* Generated on {timestamp} */\n'
+                f'\n',
+                _css_theme(tuple(colors.items()))
+            )
+        return None
+    
+    def _generate_css_variables(self, colors: Dict[str, str]) -> str:
+        """Generate CSS variables"""
+        return _css_variables(tuple(colors.items()))
     
     def _generate_css_classes(self, colors: Dict[str, str]) -> str:
         """Generate CSS classes for colors"""
-        css_lines = []
-        
-        for color_name, color_value in colors.items():
-            class_name = color_name.replace('_', '-')
-            
-            # Background color class
-            css_lines.append(f'.bg-{class_name} {{')
-            css_lines.append(f'  background-color: {color_value};')
-            css_lines.append('}')
-            css_lines.append('')
-            
-            # Text color class
-            css_lines.append(f'.text-{class_name} {{')
-            css_lines.append(f'  color: {color_value};')
-            css_lines.append('}')
-            css_lines.append('')
-            
-            # Border color class
-            css_lines.append(f'.border-{class_name} {{')
-            css_lines.append(f'  border-color: {color_value};')
-            css_lines.append('}')
-            css_lines.append('')
-        
-        return '\n'.join(css_lines)
-    
-    def _generate_complete_css(self, colors: Dict[str, str], scheme_name: str) -> str:
-        """Generate complete CSS theme"""
-        css_lines = [
-            f'/* {scheme_name} Color Scheme */',
-            f'/* Generated on {self._get_timestamp()} */',
-            '',
-            self._generate_css_variables(colors),
-            '',
-            self._generate_css_classes(colors),
-            '',
-            '/* Base styling */',
-            'body {',
-            f'  background-color: {colors.get("background", "#FFFFFF")};',
-            f'  color: {colors.get("text", "#000000")};',
-            '}',
-            '',
-            'h1, h2, h3, h4, h5, h6 {',
-            f'  color: {colors.get("primary", "#000000")};',
-            '}',
-            '',
-            'a {',
-            f'  color: {colors.get("accent", "#0066CC")};',
-            '}',
-            '',
-            'a:hover {',
-            f'  color: {colors.get("secondary", "#003366")};',
-            '}',
-            '',
-            '.highlight {',
-            f'  background-color: {colors.get("highlight", "#FFFF99")};',
-            '}',
-            '',
-            '.error {',
-            f'  color: {colors.get("error", "#CC0000")};',
-            '}',
-            '',
-            '.success {',
-            f'  color: {colors.get("success", "#006600")};',
-            '}'
-        ]
-        
-        return '\n'.join(css_lines)
+        return _css_classes(tuple(colors.items()))
     
     def _validate_colors(self, colors: Dict[str, str]) -> Dict[str, Any]:
         """Validate color format"""
@@ -474,15 +673,8 @@ class ColorSchemeService:
             'errors': []
         }
         
-        import re
-        hex_pattern = re.compile(r'^#([A-Fa-f0-9]{6}|[A-Fa-f0-9]{3})$')
-        rgb_pattern = re.compile(r'^rgb\(\s*\d+\s*,\s*\d+\s*,\s*\d+\s*\)$')
-        rgba_pattern = re.compile(r'^rgba\(\s*\d+\s*,\s*\d+\s*,\s*\d+\s*,\s*[\d.]+\s*\)$')
-        
         for color_name, color_value in colors.items():
-            if not (hex_pattern.match(color_value) or 
-                   rgb_pattern.match(color_value) or 
-                   rgba_pattern.match(color_value)):
+            if not (_HEX_COLOR_RE.fullmatch(color_value) or _COLOR_RE.match(color_value)):
                 validation['errors'].append(
                     f'Invalid color format for {color_name}: {color_value}'
                 )
@@ -492,6 +684,8 @@ class ColorSchemeService:
     
     def get_scheme_usage_stats(self) -> Dict[str, Any]:
         """Get color scheme usage statistics"""
+        self._ensure_default_schemes()
+        
         stats = {
             'total_schemes': len(self.scheme_registry['schemes']),
             'category_breakdown': {},
@@ -504,32 +698,31 @@ class ColorSchemeService:
         for category, scheme_ids in self.scheme_registry['categories'].items():
             stats['category_breakdown'][category] = len(scheme_ids)
         
-        # Most used schemes
-        schemes_by_usage = sorted(
-            self.scheme_registry['schemes'].items(),
-            key=lambda x: x[1]['usage_count'],
-            reverse=True
-        )
+        # Most used schemes; most_common only orders the top five
+        with self._usage_lock:
+            most_used = self._usage.most_common(5)
+            stats['total_usage'] = sum(self._usage.values())
         
         stats['most_used'] = [
             {
-                'name': scheme_info['name'],
-                'usage_count': scheme_info['usage_count']
+                'name': self.scheme_registry['schemes'][scheme_id].name,
+                'usage_count': usage_count
             }
-            for scheme_id, scheme_info in schemes_by_usage[:5]
+            for scheme_id, usage_count in most_used
         ]
         
-        # Accessibility and total usage
-        for scheme_info in self.scheme_registry['schemes'].values():
-            if scheme_info.get('accessibility', {}).get('wcag_aa_compliant', False):
+        # Accessibility
+        for scheme in self.scheme_registry['schemes'].values():
+            if scheme.accessibility.get('wcag_aa_compliant', False):
                 stats['accessibility_compliant'] += 1
-            stats['total_usage'] += scheme_info['usage_count']
         
         stats['timestamp'] = self._get_timestamp()
         return stats
     
     def _generate_scheme_id(self, scheme_name: str) -> str:
         """Generate unique scheme ID"""
+        # Chained replace beats str.translate here: translate maps one
+        # character at a time and is several times slower on short names
         return scheme_name.lower().replace(' ', '_').replace('-', '_')
     
     def _get_timestamp(self) -> str:
@@ -4,9 +4,154 @@ Manages font assets and metadata
 """
 
 import os
+import sys
 import json
-from typing import Dict, List, Any, Optional
+import time
+import heapq
+import threading
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
+from types import MappingProxyType
+
+# Seconds a fonts directory listing is reused before it is scanned again
+_FONT_LISTING_TTL = 1.0
+
+# Placeholder written for a font with no file; filled with the font name,
+# creation timestamp and font name again
+_PLACEHOLDER_TEMPLATE = b"""
+        Font: %b
+        Status: Placeholder file
+        Created: %b
+        
+        This is a placeholder for the %b font.
+        The actual font file should be placed in the fonts directory.
+        """
+
+# Default fonts are shared, read-only data; each service registers its own records
+_DEFAULT_FONTS = (
+    MappingProxyType({
+        'name': 'Times New Roman',
+        'family': 'Times',
+        'category': 'serif',
+        'weight': 'normal',
+        'style': 'normal',
+        'formats': ('ttf',),
+        'usage': 'Academic papers, formal documents',
+        'compatibility': ('ieee', 'nature', 'apa'),
+        'file_size': '1.2MB',
+        'character_set': 'latin_extended',
+        'license': 'commercial'
+    }),
+    MappingProxyType({
+        'name': 'Arial',
+        'family': 'Arial',
+        'category': 'sans_serif',
+        'weight': 'normal',
+        'style': 'normal',
+        'formats': ('ttf',),
+        'usage': 'Modern documents, presentations',
+        'compatibility': ('modern', 'web'),
+        'file_size': '1.1MB',
+        'character_set': 'latin_extended',
+        'license': 'commercial'
+    }),
+    MappingProxyType({
+        'name': 'Helvetica',
+        'family': 'Helvetica',
+        'category': 'sans_serif',
+        'weight': 'normal',
+        'style': 'normal',
+        'formats': ('ttf', 'otf'),
+        'usage': 'Professional documents, branding',
+        'compatibility': ('modern', 'corporate'),
+        'file_size': '1.3MB',
+        'character_set': 'latin_extended',
+        'license': 'commercial'
+    }),
+    MappingProxyType({
+        'name': 'Courier New',
+        'family': 'Courier',
+        'category': 'monospace',
+        'weight': 'normal',
+        'style': 'normal',
+        'formats': ('ttf',),
+        'usage': 'Code blocks, technical documentation',
+        'compatibility': ('technical', 'code'),
+        'file_size': '0.8MB',
+        'character_set': 'latin_basic',
+        'license': 'commercial'
+    }),
+    MappingProxyType({
+        'name': 'Georgia',
+        'family': 'Georgia',
+        'category': 'serif',
+        'weight': 'normal',
+        'style': 'normal',
+        'formats': ('ttf',),
+        'usage': 'Web content, readable documents',
+        'compatibility': ('web', 'modern'),
+        'file_size': '1.0MB',
+        'character_set': 'latin_extended',
+        'license': 'commercial'
+    })
+)
+
+# Font fields whose values repeat across many fonts
+_SHARED_VALUE_FIELDS = ('category', 'weight', 'style', 'character_set', 'license')
+_SHARED_LIST_FIELDS = ('formats', 'compatibility')
+
+def _intern_value(value: Any) -> Any:
+    """Intern string values so repeated ones share a single object"""
+    return sys.intern(value) if type(value) is str else value
+
+@dataclass(frozen=True)
+class Font:
+    """Registered font; download counts are kept by the service"""
+    
+    # Fixed attribute slots keep each record smaller than the equivalent dict
+    __slots__ = (
+        'id', 'name', 'family', 'category', 'weight', 'style', 'formats', 'usage',
+        'compatibility', 'file_size', 'character_set', 'license', 'registered',
+        'status'
+    )
+    
+    id: str
+    name: str
+    family: str
+    category: str
+    weight: str
+    style: str
+    formats: Tuple[str, ...]
+    usage: str
+    compatibility: Tuple[str, ...]
+    file_size: str
+    character_set: str
+    license: str
+    registered: str
+    status: str
+    
+    def to_dict(self, download_count: int = 0, **extra: Any) -> Dict[str, Any]:
+        """Convert record to a plain dict for responses, adding any extra fields"""
+        return {
+            'id': self.id,
+            'name': self.name,
+            'family': self.family,
+            'category': self.category,
+            'weight': self.weight,
+            'style': self.style,
+            'formats': self.formats,
+            'usage': self.usage,
+            'compatibility': self.compatibility,
+            'file_size': self.file_size,
+            'character_set': self.character_set,
+            'license': self.license,
+            'registered': self.registered,
+            'status': self.status,
+            'download_count': download_count,
+            **extra
+        }
 
 class FontService:
     """Service for managing font assets"""
@@ -15,7 +160,35 @@ class FontService:
         self.fonts_directory = 'fonts'
         self._ensure_fonts_directory()
         self.font_registry = self._initialize_font_registry()
-        self._register_default_fonts()
+        # Fonts in each category, kept alongside the category lists so counts
+        # are read without measuring every list
+        self._category_counts = Counter(dict.fromkeys(self.font_registry['categories'], 0))
+        # Font IDs for each compatibility tag, in registration order
+        self._compat_index = defaultdict(list)
+        # Font ID for each registered font's name, lowercased name and ID,
+        # so lookups by any of them skip rebuilding the ID
+        self._name_to_id: Dict[str, str] = {}
+        # Registrations run one at a time and bump the version when done
+        self._register_lock = threading.Lock()
+        self._registry_version = 0
+        # Registry version, font list and category counts served by
+        # get_available_fonts, rebuilt once the version moves on
+        self._available_cache: Optional[Tuple[int, List[Dict[str, Any]], Dict[str, int]]] = None
+        # Registry version and the encoded get_available_fonts response
+        # around its timestamp, re-encoded once the version moves on
+        self._available_json: Optional[Tuple[int, bytes, bytes]] = None
+        # Download counts live apart from the read-only font records
+        self._downloads = Counter()
+        self._downloads_lock = threading.Lock()
+        # Font record fields served by get_font_details, per font ID
+        self._details_cache: Dict[str, Dict[str, Any]] = {}
+        # Placeholder files already created by this service
+        self._placeholder_paths = set()
+        # (scan time, file names) for the fonts directory
+        self._fonts_listing: Optional[Tuple[float, frozenset]] = None
+        # Default fonts are registered on first use
+        self._defaults_loaded = False
+        self._defaults_lock = threading.Lock()
     
     def _ensure_fonts_directory(self):
         """Ensure fonts directory exists"""
@@ -37,119 +210,84 @@ class FontService:
             }
         }
     
+    def _ensure_default_fonts(self):
+        """Register default fonts if they have not been registered yet"""
+        if self._defaults_loaded:
+            return
+        with self._defaults_lock:
+            if not self._defaults_loaded:
+                self._register_default_fonts()
+                self._defaults_loaded = True
+    
     def _register_default_fonts(self):
         """Register default system fonts"""
-        default_fonts = [
-            {
-                'name': 'Times New Roman',
-                'family': 'Times',
-                'category': 'serif',
-                'weight': 'normal',
-                'style': 'normal',
-                'formats': ['ttf'],
-                'usage': 'Academic papers, formal documents',
-                'compatibility': ['ieee', 'nature', 'apa'],
-                'file_size': '1.2MB',
-                'character_set': 'latin_extended',
-                'license': 'commercial'
-            },
-            {
-                'name': 'Arial',
-                'family': 'Arial',
-                'category': 'sans_serif',
-                'weight': 'normal',
-                'style': 'normal',
-                'formats': ['ttf'],
-                'usage': 'Modern documents, presentations',
-                'compatibility': ['modern', 'web'],
-                'file_size': '1.1MB',
-                'character_set': 'latin_extended',
-                'license': 'commercial'
-            },
-            {
-                'name': 'Helvetica',
-                'family': 'Helvetica',
-                'category': 'sans_serif',
-                'weight': 'normal',
-                'style': 'normal',
-                'formats': ['ttf', 'otf'],
-                'usage': 'Professional documents, branding',
-                'compatibility': ['modern', 'corporate'],
-                'file_size': '1.3MB',
-                'character_set': 'latin_extended',
-                'license': 'commercial'
-            },
-            {
-                'name': 'Courier New',
-                'family': 'Courier',
-                'category': 'monospace',
-                'weight': 'normal',
-                'style': 'normal',
-                'formats': ['ttf'],
-                'usage': 'Code blocks, technical documentation',
-                'compatibility': ['technical', 'code'],
-                'file_size': '0.8MB',
-                'character_set': 'latin_basic',
-                'license': 'commercial'
-            },
+        timestamp = self._get_timestamp()
+        self._register_fonts([
             {
-                'name': 'Georgia',
-                'family': 'Georgia',
-                'category': 'serif',
-                'weight': 'normal',
-                'style': 'normal',
-                'formats': ['ttf'],
-                'usage': 'Web content, readable documents',
-                'compatibility': ['web', 'modern'],
-                'file_size': '1.0MB',
-                'character_set': 'latin_extended',
-                'license': 'commercial'
-            }
-        ]
-        
-        for font_info in default_fonts:
-            font_id = self._generate_font_id(font_info['name'])
-            self.font_registry['fonts'][font_id] = {
                 **font_info,
-                'id': font_id,
-                'registered': self._get_timestamp(),
-                'status': 'available',
-                'download_count': 0
+                'id': self._generate_font_id(font_info['name']),
+                'registered': timestamp,
+                'status': 'available'
             }
-            
-            # Add to category
-            category = font_info['category']
-            if category in self.font_registry['categories']:
-                self.font_registry['categories'][category].append(font_id)
+            for font_info in _DEFAULT_FONTS
+        ])
         
         # Update metadata
         self.font_registry['metadata']['total_fonts'] = len(self.font_registry['fonts'])
-        self.font_registry['metadata']['last_updated'] = self._get_timestamp()
+        self.font_registry['metadata']['last_updated'] = timestamp
+    
+    def _register_fonts(self, font_infos: List[Dict[str, Any]]):
+        """Add fonts to the registry, their categories and the compatibility index"""
+        # Build every record and its distinct compatibility tags first, so a
+        # font with unusable tags is rejected before any index is touched
+        fonts = []
+        for font_info in font_infos:
+            # Share repeated values between fonts and freeze the per-font lists
+            for field in _SHARED_VALUE_FIELDS:
+                font_info[field] = _intern_value(font_info[field])
+            for field in _SHARED_LIST_FIELDS:
+                if isinstance(font_info[field], list):
+                    font_info[field] = tuple(map(_intern_value, font_info[field]))
+            
+            font = Font(**font_info)
+            fonts.append((font, dict.fromkeys(font.compatibility)))
+        
+        with self._register_lock:
+            new_fonts = {}
+            category_ids = defaultdict(list)
+            for font, style_names in fonts:
+                new_fonts[font.id] = font
+                category_ids[font.category].append(font.id)
+                self._name_to_id[font.name] = font.id
+                self._name_to_id[font.name.lower()] = font.id
+                self._name_to_id[font.id] = font.id
+                self._details_cache.pop(font.id, None)
+                with self._downloads_lock:
+                    self._downloads[font.id] = 0
+                
+                # Index each distinct compatibility tag once
+                for style_name in style_names:
+                    self._compat_index[style_name].append(font.id)
+            
+            # Install the batch with one update per registry structure
+            self.font_registry['fonts'].update(new_fonts)
+            categories = self.font_registry['categories']
+            for category, font_ids in category_ids.items():
+                categories.setdefault(category, []).extend(font_ids)
+                self._category_counts[category] += len(font_ids)
+            
+            # Listings built before this point no longer match the registry
+            self._registry_version += 1
     
     def get_available_fonts(self) -> Dict[str, Any]:
         """Get list of available fonts"""
-        fonts_list = []
+        self._ensure_default_fonts()
         
-        for font_id, font_info in self.font_registry['fonts'].items():
-            fonts_list.append({
-                'id': font_id,
-                'name': font_info['name'],
-                'family': font_info['family'],
-                'category': font_info['category'],
-                'weight': font_info['weight'],
-                'style': font_info['style'],
-                'formats': font_info['formats'],
-                'usage': font_info['usage'],
-                'compatibility': font_info['compatibility'],
-                'status': font_info['status']
-            })
+        fonts_list, category_counts = self._get_available_summary()
         
         return {
             'fonts': fonts_list,
-            'categories': {
-                category: len(font_ids) 
-                for category, font_ids in self.font_registry['categories'].items()
-            },
+            'categories': category_counts,
             'total_fonts': len(fonts_list),
             'metadata': {
                 'timestamp': self._get_timestamp(),
@@ -157,68 +295,154 @@ class FontService:
             }
         }
     
+    def get_available_fonts_json(self) -> bytes:
+        """Get get_available_fonts response encoded as compact JSON"""
+        self._ensure_default_fonts()
+        
+        version = self._registry_version
+        available_json = self._available_json
+        if available_json is None or available_json[0] != version:
+            fonts_list, category_counts = self._get_available_summary()
+            fonts_json = json.dumps({
+                'fonts': fonts_list,
+                'categories': category_counts,
+                'total_fonts': len(fonts_list)
+            }, separators=(',', ':'))
+            # Only the timestamp changes between calls; the rest is encoded once
+            # per registry version
+            available_json = self._available_json = (
+                version,
+                f'{fonts_json[:-1]},"metadata":{{"timestamp":'.encode(),
+                b',"service":"font_service"}}\n'
+            )
+        
+        _, prefix, suffix = available_json
+        return prefix + json.dumps(self._get_timestamp()).encode() + suffix
+    
+    def _get_available_summary(self) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+        """Get cached font list and category counts, building them if needed"""
+        version = self._registry_version
+        available = self._available_cache
+        if available is not None and available[0] == version:
+            return available[1], available[2]
+        
+        fonts_list = []
+        
+        for font_id, font in self.font_registry['fonts'].items():
+            fonts_list.append({
+                'id': font_id,
+                'name': font.name,
+                'family': font.family,
+                'category': font.category,
+                'weight': font.weight,
+                'style': font.style,
+                'formats': font.formats,
+                'usage': font.usage,
+                'compatibility': font.compatibility,
+                'status': font.status
+            })
+        
+        category_counts = dict(self._category_counts)
+        # Tag the result with the version read before building, so a font
+        # registered meanwhile makes the next call rebuild
+        self._available_cache = (version, fonts_list, category_counts)
+        return fonts_list, category_counts
+    
     def get_font_details(self, font_name: str) -> Optional[Dict[str, Any]]:
         """Get detailed information for specific font"""
-        font_id = self._generate_font_id(font_name)
+        self._ensure_default_fonts()
         
-        if font_id in self.font_registry['fonts']:
-            font_info = self.font_registry['fonts'][font_id].copy()
-            
-            # Add additional details
-            font_info['metadata'] = {
+        font_id = self._name_to_id.get(font_name) or self._generate_font_id(font_name)
+        
+        font = self.font_registry['fonts'].get(font_id)
+        if font is None:
+            return None
+        
+        details = self._details_cache.get(font_id)
+        if details is None:
+            details = self._details_cache[font_id] = font.to_dict()
+        
+        # Download count changes between calls, so it is read fresh
+        return {
+            **details,
+            'download_count': self._downloads[font_id],
+            'metadata': {
                 'last_accessed': self._get_timestamp(),
                 'download_url': f'/api/fonts/{font_name}/download',
                 'preview_url': f'/api/fonts/{font_name}/preview'
             }
-            
-            return font_info
-        
-        return None
+        }
     
     def get_font_path(self, font_name: str) -> Optional[str]:
         """Get file path for font"""
-        font_id = self._generate_font_id(font_name)
+        self._ensure_default_fonts()
         
-        if font_id in self.font_registry['fonts']:
-            font_info = self.font_registry['fonts'][font_id]
+        font_id = self._name_to_id.get(font_name) or self._generate_font_id(font_name)
+        
+        font = self.font_registry['fonts'].get(font_id)
+        if font is not None:
+            # Try different file extensions against the directory listing; a
+            # newly installed file is found once the listing is rescanned
+            base_name = font_name.lower().replace(' ', '_')
+            file_path = self._find_font_file(base_name, font.formats, self._list_font_files())
             
-            # Try different file extensions
-            for format_ext in font_info['formats']:
-                file_path = os.path.join(
-                    self.fonts_directory, 
-                    f"{font_name.lower().replace(' ', '_')}.{format_ext}"
-                )
-                if os.path.exists(file_path):
-                    # Update download count
-                    self.font_registry['fonts'][font_id]['download_count'] += 1
-                    return file_path
+            if file_path is not None:
+                # Update download count
+                with self._downloads_lock:
+                    self._downloads[font_id] += 1
+                return file_path
             
             # If no file exists, create a placeholder
             return self._create_font_placeholder(font_name)
         
         return None
     
+    def _find_font_file(self, base_name: str, formats: Tuple[str, ...],
+                        font_files: frozenset) -> Optional[str]:
+        """Find path of the first font file present for the given formats"""
+        for format_ext in formats:
+            file_name = f"{base_name}.{format_ext}"
+            if file_name in font_files:
+                return os.path.join(self.fonts_directory, file_name)
+        return None
+    
+    def _list_font_files(self) -> frozenset:
+        """List file names in the fonts directory, rescanning once the listing is stale"""
+        now = time.monotonic()
+        listing = self._fonts_listing
+        if listing is None or now - listing[0] > _FONT_LISTING_TTL:
+            try:
+                with os.scandir(self.fonts_directory) as entries:
+                    font_files = frozenset(entry.name for entry in entries if entry.is_file())
+            except OSError:
+                font_files = frozenset()
+            listing = self._fonts_listing = (now, font_files)
+        return listing[1]
+    
     def get_fonts_by_category(self, category: str) -> Dict[str, Any]:
         """Get fonts by category"""
-        if category not in self.font_registry['categories']:
+        self._ensure_default_fonts()
+        
+        font_ids = self.font_registry['categories'].get(category)
+        if font_ids is None:
             return {
                 'error': f'Unknown category: {category}',
                 'available_categories': list(self.font_registry['categories'].keys())
             }
         
-        font_ids = self.font_registry['categories'][category]
+        registered_fonts = self.font_registry['fonts']
         fonts = []
         
         for font_id in font_ids:
-            if font_id in self.font_registry['fonts']:
-                font_info = self.font_registry['fonts'][font_id]
+            font = registered_fonts.get(font_id)
+            if font is not None:
                 fonts.append({
                     'id': font_id,
-                    'name': font_info['name'],
-                    'family': font_info['family'],
-                    'weight': font_info['weight'],
-                    'style': font_info['style'],
-                    'usage': font_info['usage']
+                    'name': font.name,
+                    'family': font.family,
+                    'weight': font.weight,
+                    'style': font.style,
+                    'usage': font.usage
                 })
         
         return {
@@ -230,18 +454,20 @@ class FontService:
     
     def get_fonts_by_compatibility(self, style_name: str) -> Dict[str, Any]:
         """Get fonts compatible with specific style"""
+        self._ensure_default_fonts()
+        
         compatible_fonts = []
         
-        for font_id, font_info in self.font_registry['fonts'].items():
-            if style_name in font_info.get('compatibility', []):
-                compatible_fonts.append({
-                    'id': font_id,
-                    'name': font_info['name'],
-                    'family': font_info['family'],
-                    'category': font_info['category'],
-                    'weight': font_info['weight'],
-                    'usage': font_info['usage']
-                })
+        for font_id in self._compat_index.get(style_name, ()):
+            font = self.font_registry['fonts'][font_id]
+            compatible_fonts.append({
+                'id': font_id,
+                'name': font.name,
+                'family': font.family,
+                'category': font.category,
+                'weight': font.weight,
+                'usage': font.usage
+            })
         
         return {
             'style': style_name,
@@ -252,6 +478,8 @@ class FontService:
     
     def register_custom_font(self, font_data: Dict[str, Any]) -> Dict[str, Any]:
         """Register a custom font"""
+        self._ensure_default_fonts()
+        
         required_fields = ['name', 'family', 'category']
         for field in required_fields:
             if field not in font_data:
@@ -269,6 +497,13 @@ class FontService:
                 'error': f'Font {font_data["name"]} already exists'
             }
         
+        # Treat a missing, null or non-list compatibility as no tags
+        compatibility = font_data.get('compatibility')
+        if not isinstance(compatibility, list):
+            compatibility = []
+        
+        timestamp = self._get_timestamp()
+        
         # Add default values
         font_info = {
             'id': font_id,
@@ -279,38 +514,32 @@ class FontService:
             'style': font_data.get('style', 'normal'),
             'formats': font_data.get('formats', ['ttf']),
             'usage': font_data.get('usage', 'General purpose'),
-            'compatibility': font_data.get('compatibility', []),
+            'compatibility': compatibility,
             'file_size': font_data.get('file_size', 'Unknown'),
             'character_set': font_data.get('character_set', 'latin_basic'),
             'license': font_data.get('license', 'custom'),
-            'registered': self._get_timestamp(),
-            'status': 'available',
-            'download_count': 0
+            'registered': timestamp,
+            'status': 'available'
         }
         
         # Register font
-        self.font_registry['fonts'][font_id] = font_info
-        
-        # Add to category
-        category = font_info['category']
-        if category in self.font_registry['categories']:
-            self.font_registry['categories'][category].append(font_id)
-        else:
-            self.font_registry['categories'][category] = [font_id]
+        self._register_fonts([font_info])
         
         # Update metadata
         self.font_registry['metadata']['total_fonts'] = len(self.font_registry['fonts'])
-        self.font_registry['metadata']['last_updated'] = self._get_timestamp()
+        self.font_registry['metadata']['last_updated'] = timestamp
         
         return {
             'success': True,
             'font_id': font_id,
             'message': f'Font {font_data["name"]} registered successfully',
-            'timestamp': self._get_timestamp()
+            'timestamp': timestamp
         }
     
     def get_font_usage_stats(self) -> Dict[str, Any]:
         """Get font usage statistics"""
+        self._ensure_default_fonts()
+        
         stats = {
             'total_fonts': len(self.font_registry['fonts']),
             'category_breakdown': {},
@@ -320,54 +549,66 @@ class FontService:
         }
         
         # Category breakdown
-        for category, font_ids in self.font_registry['categories'].items():
-            stats['category_breakdown'][category] = len(font_ids)
-        
-        # Most downloaded fonts
-        fonts_by_downloads = sorted(
-            self.font_registry['fonts'].items(),
-            key=lambda x: x[1]['download_count'],
-            reverse=True
-        )
+        stats['category_breakdown'] = dict(self._category_counts)
+        
+        # Most downloaded fonts and license breakdown in one pass; the heap
+        # keeps only the top five, and ties keep registration order
+        top_downloads = []
+        license_counts = Counter()
+        downloads = self._downloads
+        for index, font in enumerate(self.font_registry['fonts'].values()):
+            license_counts[font.license] += 1
+            entry = (downloads[font.id], -index, font)
+            if len(top_downloads) < 5:
+                heapq.heappush(top_downloads, entry)
+            else:
+                heapq.heappushpop(top_downloads, entry)
+        top_downloads.sort(reverse=True)
         
         stats['most_downloaded'] = [
             {
-                'name': font_info['name'],
-                'downloads': font_info['download_count']
+                'name': font.name,
+                'downloads': download_count
             }
-            for font_id, font_info in fonts_by_downloads[:5]
+            for download_count, _, font in top_downloads
         ]
         
-        # License breakdown
-        license_counts = {}
-        for font_info in self.font_registry['fonts'].values():
-            license_type = font_info.get('license', 'unknown')
-            license_counts[license_type] = license_counts.get(license_type, 0) + 1
-        
-        stats['license_breakdown'] = license_counts
+        stats['license_breakdown'] = dict(license_counts)
         stats['timestamp'] = self._get_timestamp()
         
         return stats
     
     def _create_font_placeholder(self, font_name: str) -> str:
-        """Create a placeholder font file"""
-        placeholder_content = f"""
-        Font: {font_name}
-        Status: Placeholder file
-        Created: {self._get_timestamp()}
-        
-        This is a placeholder for the {font_name} font.
-        The actual font file should be placed in the fonts directory.
-        """
-        
+        """Create a placeholder font file unless one already exists"""
         placeholder_path = os.path.join(
             self.fonts_directory, 
             f"{font_name.lower().replace(' ', '_')}_placeholder.txt"
         )
+        # A remembered placeholder is reused only while its file still exists
+        if placeholder_path in self._placeholder_paths and os.path.exists(placeholder_path):
+            return placeholder_path
         
-        with open(placeholder_path, 'w') as f:
-            f.write(placeholder_content)
+        encoded_name = font_name.encode()
+        placeholder_content = _PLACEHOLDER_TEMPLATE % (
+            encoded_name, self._get_timestamp().encode(), encoded_name
+        )
+        
+        # Exclusive create: a placeholder written earlier, by this or another
+        # process, is kept rather than rewritten
+        try:
+            fd = os.open(placeholder_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            pass
+        else:
+            try:
+                # os.write may write fewer bytes than given; keep going until done
+                remaining = memoryview(placeholder_content)
+                while remaining:
+                    remaining = remaining[os.write(fd, remaining):]
+            finally:
+                os.close(fd)
         
+        self._placeholder_paths.add(placeholder_path)
         return placeholder_path
     
     def _generate_font_id(self, font_name: str) -> str: